@@ -6,10 +6,12 @@ Vocabulary:
 "semitone distance": A number of semitones.
 """
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
-from functools import total_ordering
-from typing import Self
-from collections.abc import Iterator
+from functools import lru_cache, total_ordering
+from operator import attrgetter
+from string import digits
+from typing import Self, final
 
 
 # Enum for musical note letters
@@ -29,44 +31,44 @@ class NoteLetter(Enum):
 
     def __add__(self, other: int) -> "NoteLetter":
         """When adding letters, treat them as integers and wrap around if necessary."""
-        new_value = (self.value + other) % len(NoteLetter)
-        return NoteLetter(new_value)
+        # Read _value_ directly here and in the other hot accessors, since Enum.value
+        # is a Python-level property that costs more than the table lookup itself
+        return _LETTER_SUMS[self._value_][other % 7]
 
     def __sub__(self, other: int) -> "NoteLetter":
         """When subtracting letters, treat them as integers and wrap around if necessary."""
-        new_value = (self.value - other) % len(NoteLetter)
-        return NoteLetter(new_value)
+        return _LETTER_SUMS[self._value_][-other % 7]
 
     @property
     def semitone_offset(self) -> int:
         """Returns how many semitones this letter is away from C."""
-        match self:
-            case NoteLetter.C:
-                return 0
-            case NoteLetter.D:
-                return 2
-            case NoteLetter.E:
-                return 4
-            case NoteLetter.F:
-                return 5
-            case NoteLetter.G:
-                return 7
-            case NoteLetter.A:
-                return 9
-            case NoteLetter.B:
-                return 11
+        return _LETTER_SEMITONE_OFFSETS[self._value_]
 
-    @property
     def __int__(self) -> int:
-        return self.value
+        return self._value_
 
     @classmethod
     def from_str(cls, s: str) -> "NoteLetter":
-        """Convert a string to a NoteLetter by matching the string with the name of each                    enum variant."""
-        for note in cls:
-            if note.name == s:
-                return note
-        raise ValueError(f"Invalid note letter string: {s}")
+        """Convert a string to a NoteLetter by looking up the name of the enum variant."""
+        try:
+            return _NOTE_LETTERS_BY_NAME[s]
+        except KeyError as err:
+            raise ValueError(f"Invalid note letter string: {s}") from err
+
+
+# Semitone offset from C of each letter, indexed by the letter's value
+_LETTER_SEMITONE_OFFSETS: tuple[int, ...] = (0, 2, 4, 5, 7, 9, 11)
+
+_NOTE_LETTERS_BY_NAME: dict[str, NoteLetter] = {
+    letter.name: letter for letter in NoteLetter
+}
+
+# _LETTER_SUMS[a][b] is the letter b steps above the letter with value a, wrapping
+# around after B. Avoids the value-to-member lookup of NoteLetter(...) when adding
+_LETTER_SUMS: tuple[tuple[NoteLetter, ...], ...] = tuple(
+    tuple(NoteLetter((a + b) % len(NoteLetter)) for b in range(len(NoteLetter)))
+    for a in range(len(NoteLetter))
+)
 
 
 class NoteAlteration(Enum):
@@ -81,78 +83,119 @@ class NoteAlteration(Enum):
     @property
     def semitone_difference(self) -> int:
         """Returns how many semitones this alteration modifies the note by."""
-        return self.value
+        return self._value_
 
     def __int__(self) -> int:
-        return self.semitone_difference
+        return self._value_
 
     def __str__(self) -> str:
-        match self:
-            case NoteAlteration.SHARP:
-                return "♯"
-            case NoteAlteration.FLAT:
-                return "♭"
-            case NoteAlteration.NATURAL:
-                return "♮"
-            case NoteAlteration.DOUBLE_SHARP:
-                return "𝄪"
-            case NoteAlteration.DOUBLE_FLAT:
-                return "𝄫"
+        return _ALTERATION_STRINGS[self._value_ + 2]
 
     @classmethod
     def from_str(cls, s: str) -> "NoteAlteration":
         try:
-            return {
-                "♯": cls.SHARP,
-                "#": cls.SHARP,
-                "♭": cls.FLAT,
-                "b": cls.FLAT,
-                "♮": cls.NATURAL,
-                "n": cls.NATURAL,
-                "𝄪": cls.DOUBLE_SHARP,
-                "##": cls.DOUBLE_SHARP,
-                "𝄫": cls.DOUBLE_FLAT,
-                "bb": cls.DOUBLE_FLAT,
-            }[s]
+            return _ALTERATIONS_BY_SYMBOL[s]
         except KeyError as err:
             raise ValueError(f"Invalid alteration string: {s}") from err
 
 
-class Note:
-    """An abstract musical note, without a specific octave."""
+# The symbol of each alteration, indexed by its value shifted from -2..2 to 0..4
+_ALTERATION_STRINGS: tuple[str, ...] = ("𝄫", "♭", "♮", "♯", "𝄪")
 
-    def __init__(self, letter: NoteLetter, alteration: NoteAlteration):
-        self.letter = letter
-        self.alteration = alteration
+# Every accepted spelling of an alteration, both unicode and ASCII. Built once at
+# import instead of on every call to NoteAlteration.from_str.
+_ALTERATIONS_BY_SYMBOL: dict[str, NoteAlteration] = {
+    "♯": NoteAlteration.SHARP,
+    "#": NoteAlteration.SHARP,
+    "♭": NoteAlteration.FLAT,
+    "b": NoteAlteration.FLAT,
+    "♮": NoteAlteration.NATURAL,
+    "n": NoteAlteration.NATURAL,
+    "𝄪": NoteAlteration.DOUBLE_SHARP,
+    "##": NoteAlteration.DOUBLE_SHARP,
+    "𝄫": NoteAlteration.DOUBLE_FLAT,
+    "bb": NoteAlteration.DOUBLE_FLAT,
+}
 
-    @classmethod
-    def from_str(cls, s: str) -> Self:
-        """Create a Note from a string representation like "C", "C#" or "Db"."""
-        if len(s) == 1:
-            return cls(NoteLetter.from_str(s), NoteAlteration.NATURAL)
 
-        letter = NoteLetter.from_str(s[0])
-        alteration = NoteAlteration.from_str(s[1:])
-        return cls(letter, alteration)
+# Every note that has been created, see Note.__new__
+_NOTE_POOL: dict[tuple[NoteLetter, NoteAlteration], "Note"] = {}
 
-    @property
-    def semitone_offset(self) -> int:
-        """Returns how many semitones away from C this note is. The semitone offset is the sum of the letter's semitone offset and the alteration's semitone difference.
 
-        Examples:
-        - C = 0
-        - C# = 1
-        - C## = 2
-        - Cb = -1
-        - Cbb = -2
-        - B# = 12
-        - B## = 13
+@final
+class Note:
+    """An abstract musical note, without a specific octave.
+
+    There are only 35 distinct notes, so they are interned: creating a note with the
+    same letter and alteration twice returns the same instance. Two non-octaved notes
+    are therefore only equal if they are the same object, which is exactly when they
+    have the same letter and alteration.
+    """
+
+    __slots__ = ("_hash", "_str", "alteration", "letter", "semitone_offset")
+
+    letter: NoteLetter
+    alteration: NoteAlteration
+    # How many semitones away from C this note is. The semitone offset is the sum of
+    # the letter's semitone offset and the alteration's semitone difference.
+    # Examples: C = 0, C# = 1, C## = 2, Cb = -1, Cbb = -2, B# = 12, B## = 13
+    semitone_offset: int
+    _hash: int
+    _str: str
+
+    def __new__(cls, letter: NoteLetter, alteration: NoteAlteration) -> "Note":
+        note = _NOTE_POOL.get((letter, alteration))
+        if note is None:
+            note = super().__new__(cls)
+            # Notes are shared through the pool, so they are immutable and their
+            # fields can only be set here, bypassing __setattr__
+            object.__setattr__(note, "letter", letter)
+            object.__setattr__(note, "alteration", alteration)
+            object.__setattr__(
+                note, "semitone_offset", letter.semitone_offset + alteration.value
+            )
+            # A small integer (0 to 34) that is unique to each note. The alteration
+            # is shifted from -2..2 to 0..4 so that it fits between two letters
+            object.__setattr__(
+                note, "_hash", letter.value * len(NoteAlteration) + alteration.value + 2
+            )
+            object.__setattr__(
+                note,
+                "_str",
+                f"{letter}{alteration}"
+                if alteration != NoteAlteration.NATURAL
+                else str(letter),
+            )
+            _NOTE_POOL[letter, alteration] = note
+        return note
 
-        """
-        return self.letter.semitone_offset + self.alteration.semitone_difference
+    def __init_subclass__(cls) -> None:
+        # The pool is keyed on letter and alteration only, so a subclass would get
+        # plain Note instances back from its constructor
+        raise TypeError("Note cannot be subclassed, since notes are interned")
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Cannot modify {name!r}, notes are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete {name!r}, notes are immutable")
+
+    def __reduce__(self) -> tuple[type["Note"], tuple[NoteLetter, NoteAlteration]]:
+        # Make copy and pickle go through __new__, so they return the interned note
+        return (Note, (self.letter, self.alteration))
+
+    @classmethod
+    def from_str(cls, s: str) -> "Note":
+        """Create a Note from a string representation like "C", "C#" or "Db"."""
+        # There are few enough valid note strings that all of them are
+        # precomputed, which makes parsing a single lookup
+        try:
+            return _NOTES_BY_NAME[s]
+        except KeyError as err:
+            raise ValueError(f"Invalid note string: {s}") from err
 
     @classmethod
-    def from_semitone_offset(cls, semitone_offset: int) -> set[Self]:
+    def from_semitone_offset(cls, semitone_offset: int) -> frozenset["Note"]:
         """Return all possible notes that are a specific number of semitones away from C.
 
         Examples:
@@ -167,37 +210,81 @@ class Note:
         - 13 -> B##
 
         """
-        # Loop through all possible enumerations of NoteLetter and NoteAlteration
-        notes = set(
-            cls(note_letter, note_alteration)
-            for note_letter in NoteLetter
-            for note_alteration in NoteAlteration
-            if note_letter.semitone_offset + note_alteration.semitone_difference
-            == semitone_offset
-        )
+        if not _MIN_SEMITONE_OFFSET <= semitone_offset <= _MAX_SEMITONE_OFFSET:
+            return frozenset()
+        return _NOTES_BY_SEMITONE_OFFSET[semitone_offset - _MIN_SEMITONE_OFFSET]
 
-        return notes
+    # eq is inherited from object, since notes are interned
 
-    def __eq__(self, other: object) -> bool:
-        """Two non-octaved notes are only equal if they have the same letter and alteration."""
-        if not isinstance(other, Note):
-            return NotImplemented
-        return self.letter == other.letter and self.alteration == other.alteration
+    def __hash__(self) -> int:
+        # Unlike the identity hash, this is the same in every run
+        return self._hash
 
     # lt is not implemented because it doesn't make sense to compare notes without an octave
 
     def __str__(self) -> str:
-        return (
-            f"{self.letter}{self.alteration}"
-            if self.alteration != NoteAlteration.NATURAL
-            else str(self.letter)
-        )
+        return self._str
 
     def __repr__(self) -> str:
         return f"Note({self.letter}, {self.alteration})"
 
-    def __hash__(self) -> int:
-        return hash((self.letter, self.alteration))
+
+# The lowest (Cbb) and highest (B##) semitone offsets a note can have
+_MIN_SEMITONE_OFFSET = -2
+_MAX_SEMITONE_OFFSET = 13
+
+
+def _group_notes_by_semitone_offset() -> tuple[frozenset[Note], ...]:
+    """Group every combination of NoteLetter and NoteAlteration by semitone offset.
+
+    The result is indexed by the semitone offset minus _MIN_SEMITONE_OFFSET.
+    """
+    groups: list[set[Note]] = [
+        set() for _ in range(_MIN_SEMITONE_OFFSET, _MAX_SEMITONE_OFFSET + 1)
+    ]
+    for note_letter in NoteLetter:
+        for note_alteration in NoteAlteration:
+            note = Note(note_letter, note_alteration)
+            groups[note.semitone_offset - _MIN_SEMITONE_OFFSET].add(note)
+    return tuple(frozenset(notes) for notes in groups)
+
+
+# There are only 16 distinct semitone offsets, so compute the notes for each of
+# them once instead of on every call to Note.from_semitone_offset
+_NOTES_BY_SEMITONE_OFFSET = _group_notes_by_semitone_offset()
+
+# Every string accepted by Note.from_str, e.g. "C", "C#", "C♯" and "C##"
+_NOTES_BY_NAME: dict[str, Note] = {
+    letter_name + symbol: Note(letter, alteration)
+    for letter_name, letter in _NOTE_LETTERS_BY_NAME.items()
+    for symbol, alteration in {
+        "": NoteAlteration.NATURAL,
+        **_ALTERATIONS_BY_SYMBOL,
+    }.items()
+}
+
+
+def _group_notes_by_octave_position() -> tuple[tuple[tuple[Note, int], ...], ...]:
+    """For each semitone offset within an octave (0 to 11), list the notes that sound there.
+
+    Each note is paired with the octave shift needed for it to sound in the octave.
+    Edge cases close to octave changes need this shift. Let X denote an octave:
+
+    Case 1: "CX" can be interpreted as being in octave X-1 (B#)
+    Case 2: "C#X" can be interpreted as being in octave X-1 (B##)
+    Case 3: "BX" can be interpreted as being in octave X+1 (Cb)
+    Case 4: "BbX" can be interpreted as being in octave X+1 (Cbb)
+    """
+    positions: list[list[tuple[Note, int]]] = [[] for _ in range(12)]
+    for semitone_offset, notes in enumerate(
+        _NOTES_BY_SEMITONE_OFFSET, start=_MIN_SEMITONE_OFFSET
+    ):
+        octave_shift, position = divmod(semitone_offset, 12)
+        positions[position].extend((note, -octave_shift) for note in notes)
+    return tuple(tuple(notes) for notes in positions)
+
+
+_NOTES_BY_OCTAVE_POSITION = _group_notes_by_octave_position()
 
 
 class Interval(Enum):
@@ -216,83 +303,100 @@ class Interval(Enum):
     MAJOR_SEVENTH = (11, 6)
     PERFECT_OCTAVE = (12, 7)
 
-    @property
-    def semitone_distance(self) -> int:
-        """Get the semitone distance of the interval."""
-        return self.value[0]
+    def __init__(self, semitone_distance: int, letter_distance: int) -> None:
+        # Unpack the value once per member, so that reading the distances is a plain
+        # attribute lookup instead of a property indexing into the value tuple
+        self.semitone_distance = semitone_distance
+        self.letter_distance = letter_distance
+
+
+def _add_intervals_to_notes() -> dict[tuple[Note, Interval], tuple[Note, int]]:
+    """Map every note and interval to the resulting note and how many octaves up it is.
+
+    This is only done for notes without double accidentals. Otherwise we would have to
+    handle complex cases like B## + M3 = D###.
+    """
+    sums = {}
+    for note in (
+        Note(note_letter, note_alteration)
+        for note_letter in NoteLetter
+        for note_alteration in (
+            NoteAlteration.FLAT,
+            NoteAlteration.NATURAL,
+            NoteAlteration.SHARP,
+        )
+    ):
+        for interval in Interval:
+            # The letter distance alone decides the new letter and whether we wrap
+            # around into the next octave. The semitones left over become the alteration
+            octave_shift, letter_value = divmod(
+                note.letter.value + interval.letter_distance, len(NoteLetter)
+            )
+            letter = NoteLetter(letter_value)
+            alteration = NoteAlteration(
+                note.semitone_offset
+                + interval.semitone_distance
+                - 12 * octave_shift
+                - letter.semitone_offset
+            )
+            sums[note, interval] = (Note(letter, alteration), octave_shift)
+    return sums
 
-    @property
-    def letter_distance(self) -> int:
-        """Get the letter distance of the interval."""
-        return self.value[1]
+
+# There are only 21 notes without double accidentals and 12 intervals, so the result
+# of every addition is computed once instead of in every call to NoteInOctave.__add__
+_INTERVAL_SUMS = _add_intervals_to_notes()
 
 
 @total_ordering
 class NoteInOctave:
     """A concrete musical note in a specific octave."""
 
+    __slots__ = ("_hash", "absolute_semitone_offset", "note", "octave")
+
+    note: Note
+    octave: int
+    absolute_semitone_offset: int
+    _hash: int
+
     def __init__(self, note: Note, octave: int):
-        self.note = note
         assert octave >= 0, "Octaves cannot be negative"
-        self.octave = octave
+        # Octaved notes are immutable, since the fields below are derived from the
+        # note and octave. They can only be set here, bypassing __setattr__
+        object.__setattr__(self, "note", note)
+        object.__setattr__(self, "octave", octave)
+        # The semitone offset from C0. Stored since it is needed for every comparison
+        object.__setattr__(
+            self, "absolute_semitone_offset", 12 * octave + note.semitone_offset
+        )
+        # Hash the spelling, not the pitch, so that enharmonic notes like B#3 and C4
+        # can both be in a set. Notes hash to 0..34, so this is unique per spelling
+        object.__setattr__(self, "_hash", 35 * octave + note._hash)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Cannot modify {name!r}, octaved notes are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete {name!r}, octaved notes are immutable")
+
+    def __reduce__(self) -> tuple[type["NoteInOctave"], tuple[Note, int]]:
+        # Rebuild through __init__, since the default restore uses __setattr__
+        return (type(self), (self.note, self.octave))
 
     @classmethod
-    def from_absolute_semitone_offset(cls, absolute_semitone_offset: int) -> set[Self]:
-        """Return all possible notes that are a specific number of semitones away from C0."""
-        # Find the candidate offset within the octave, and the candidate octave.
-        #
-        # Edge cases close to octave changes need to be handled carefully. Let X denote an octave.
-        #
-        # Case 1: "CX" can be interpreted as being in octave X-1 (B#)
-        # Case 2: "C#X" can be interpreted as being in octave X-1 (B##)
-        # Case 3: "BY" can be interpreted as being in octave Y+1 (Cb)
-        # Case 4: "BbY" can be interpreted as being in octave Y+1 (Cbb)
-
-        if absolute_semitone_offset % 12 == 0:
-            semitone_offset_candidates = {0, 12}
-            candidate_octaves = {
-                absolute_semitone_offset // 12,
-                absolute_semitone_offset // 12 - 1,
-            }
-        elif absolute_semitone_offset % 12 == 1:
-            semitone_offset_candidates = {1, 13}
-            candidate_octaves = {
-                absolute_semitone_offset // 12,
-                absolute_semitone_offset // 12 - 1,
-            }
-        elif absolute_semitone_offset % 12 == 11:
-            semitone_offset_candidates = {11, -1}
-            candidate_octaves = {
-                absolute_semitone_offset // 12,
-                absolute_semitone_offset // 12 + 1,
-            }
-        elif absolute_semitone_offset % 12 == 10:
-            semitone_offset_candidates = {10, -2}
-            candidate_octaves = {
-                absolute_semitone_offset // 12,
-                absolute_semitone_offset // 12 + 1,
-            }
-        else:
-            semitone_offset_candidates = {absolute_semitone_offset % 12}
-            candidate_octaves = {absolute_semitone_offset // 12}
-
-        # Find all possible non-octaved notes
-        notes = set.union(
-            *(
-                Note.from_semitone_offset(semitone_offset)
-                for semitone_offset in semitone_offset_candidates
-            )
-        )
+    def from_absolute_semitone_offset(
+        cls, absolute_semitone_offset: int
+    ) -> frozenset["NoteInOctave"]:
+        """Return all possible notes that are a specific number of semitones away from C0.
 
-        # Keep only notes and octaves such that their semitone offset adds up to the absolute semitone offset
-        return set(
-            cls(note, octave)
-            for note in notes
-            for octave in candidate_octaves
-            if note.semitone_offset + octave * 12 == absolute_semitone_offset
-        )
+        The result is precomputed and shared between calls for C0 up to B10, which is why
+        it is immutable.
+        """
+        if 0 <= absolute_semitone_offset < _PRECOMPUTED_ABSOLUTE_SEMITONE_OFFSETS:
+            return _NOTES_IN_OCTAVE_BY_ABSOLUTE_OFFSET[absolute_semitone_offset]
+        return _spell_absolute_semitone_offset(absolute_semitone_offset)
 
-    def from_semitone_distance(self, semitone_offset: int) -> set["NoteInOctave"]:
+    def from_semitone_distance(self, semitone_offset: int) -> frozenset["NoteInOctave"]:
         """Return all possible notes that are a specific number of semitones away from this note."""
         return NoteInOctave.from_absolute_semitone_offset(
             self.absolute_semitone_offset + semitone_offset
@@ -300,41 +404,23 @@ class NoteInOctave:
 
     def __add__(self, interval: Interval) -> "NoteInOctave":
         """Add an interval to the note, potentially changing its octave."""
-        # This is only implemented for notes without double accidentals. Otherwise we would have to handle
-        # complex cases like B## + M3 = D###4
-        if self.note.alteration in (
-            NoteAlteration.DOUBLE_SHARP,
-            NoteAlteration.DOUBLE_FLAT,
-        ):
-            raise ValueError("Cannot add intervals to notes with double accidentals.")
-
-        # Find all possible notes that are a specific number of semitones away from this note
-        feasible_notes = self.from_semitone_distance(interval.semitone_distance)
-
-        # Only one of these notes will have the correct letter
-        new_notes = [
-            note
-            for note in feasible_notes
-            if note.letter - interval.letter_distance == self.letter
-        ]
-        assert len(new_notes) == 1, (
-            "There should only be one correct note after adding an interval"
-        )
-        new_note = new_notes[0]
+        try:
+            note, octave_shift = _INTERVAL_SUMS[self.note, interval]
+        except KeyError:
+            if self.note.alteration in (
+                NoteAlteration.DOUBLE_SHARP,
+                NoteAlteration.DOUBLE_FLAT,
+            ):
+                raise ValueError(
+                    "Cannot add intervals to notes with double accidentals."
+                ) from None
+            return NotImplemented
 
-        return new_note
+        return NoteInOctave(note, self.octave + octave_shift)
 
     def __str__(self) -> str:
         return f"{self.note}{self.octave}"
 
-    @property
-    def absolute_semitone_offset(self) -> int:
-        """The absolute semitone offset of the note is the semitone offset from C0."""
-        # absolute_semitone_offset = 12*self.octave + self.note.letter.semitone_offset + self.note.alteration.semitone_difference
-        absolute_semitone_offset = 12 * self.octave + self.note.semitone_offset
-
-        return absolute_semitone_offset
-
     def __int__(self) -> int:
         # The integer representation of the note is absolute semitone offset
         return self.absolute_semitone_offset
@@ -344,32 +430,32 @@ class NoteInOctave:
 
     def __eq__(self, other: object) -> bool:
         """Comparison is forwarded to the absolute semitone offset."""
-        assert isinstance(other, NoteInOctave), (
-            "Cannot compare NoteInOctave with non-NoteInOctave object"
-        )
+        if not isinstance(other, NoteInOctave):
+            return NotImplemented
         return self.absolute_semitone_offset == other.absolute_semitone_offset
 
     def __lt__(self, other: object) -> bool:
         """Comparison is forwarded to the absolute semitone offset."""
-        assert isinstance(other, NoteInOctave), (
-            "Cannot compare NoteInOctave with non-NoteInOctave object"
-        )
+        if not isinstance(other, NoteInOctave):
+            return NotImplemented
         return self.absolute_semitone_offset < other.absolute_semitone_offset
 
     def __hash__(self) -> int:
-        return hash((self.note, self.octave))
+        return self._hash
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_str(cls, s: str) -> Self:
         """Convert a string to an octaved note by splitting the string into note and octave parts.
 
         Examples: NoteInOctave.from_str("C4"), NoteInOctave.from_str("D♯5"), NoteInOctave.from_str("B♭3")
         """
-        note_str = s[:-1]
-        octave_str = s[-1]
-        note = Note.from_str(note_str)
-        octave = int(octave_str)
-        return cls(note, octave)
+        # The octave is every trailing digit, so that octaves like 10 work too
+        note_str = s.rstrip(digits)
+        octave_str = s[len(note_str) :]
+        if not octave_str:
+            raise ValueError(f"Missing octave in note string: {s}")
+        return cls(Note.from_str(note_str), int(octave_str))
 
     # Forward some properties to the underlying note to avoid breaking law of demeter
     @property
@@ -381,17 +467,81 @@ class NoteInOctave:
         return self.note.alteration
 
 
+def _spell_absolute_semitone_offset(
+    absolute_semitone_offset: int,
+) -> frozenset[NoteInOctave]:
+    """Return every spelling of the pitch a number of semitones away from C0."""
+    octave, semitone_offset = divmod(absolute_semitone_offset, 12)
+    return frozenset(
+        NoteInOctave(note, octave + octave_shift)
+        for note, octave_shift in _NOTES_BY_OCTAVE_POSITION[semitone_offset]
+        if octave + octave_shift >= 0
+    )
+
+
+# Precompute all spellings of every pitch in octaves 0 to 10, which is far beyond the
+# range of any instrument. Other pitches are spelled on demand
+_PRECOMPUTED_ABSOLUTE_SEMITONE_OFFSETS = 12 * 11
+_NOTES_IN_OCTAVE_BY_ABSOLUTE_OFFSET = tuple(
+    _spell_absolute_semitone_offset(absolute_semitone_offset)
+    for absolute_semitone_offset in range(_PRECOMPUTED_ABSOLUTE_SEMITONE_OFFSETS)
+)
+
+
 class Chord:
-    """A Chord is a set of octaved notes."""
+    """A Chord is a set of octaved notes, kept sorted from lowest to highest."""
+
+    __slots__ = ("_hash", "_note_set", "_str", "notes")
+
+    notes: tuple[NoteInOctave, ...]
+    _note_set: frozenset[NoteInOctave]
+    _hash: int
+    _str: str | None
+
+    def __init__(self, notes: Iterable[NoteInOctave]):
+        # Chords are immutable, since the hash and the formatted string are cached.
+        # The fields can only be set here and in __str__, bypassing __setattr__
+        note_set = frozenset(notes)
+        # Deduplicate like a set would, then sort once so printing and iterating
+        # the chord never has to
+        object.__setattr__(self, "_note_set", note_set)
+        object.__setattr__(
+            self,
+            "notes",
+            tuple(sorted(note_set, key=attrgetter("absolute_semitone_offset"))),
+        )
+        object.__setattr__(self, "_hash", hash(note_set))
+        # Formatted on first use, see __str__
+        object.__setattr__(self, "_str", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Cannot modify {name!r}, chords are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete {name!r}, chords are immutable")
 
-    def __init__(self, notes: set[NoteInOctave]):
-        self.notes = notes
+    def __reduce__(self) -> tuple[type["Chord"], tuple[tuple[NoteInOctave, ...]]]:
+        # Rebuild through __init__, since the default restore uses __setattr__
+        return (type(self), (self.notes,))
 
     def __iter__(self) -> Iterator[NoteInOctave]:
         return iter(self.notes)
 
+    def __eq__(self, other: object) -> bool:
+        """Two chords are equal if they consist of the same notes, spelled the same way."""
+        if not isinstance(other, Chord):
+            return NotImplemented
+        return self._hash == other._hash and self._note_set == other._note_set
+
+    def __hash__(self) -> int:
+        return self._hash
+
     def __repr__(self) -> str:
-        return f"Chord({{{','.join(str(note) for note in sorted(self.notes))}}})"
+        return f"Chord({self})"
 
     def __str__(self) -> str:
-        return f"{{{','.join(str(note) for note in sorted(self.notes))}}}"
+        if self._str is None:
+            formatted = f"{{{','.join(str(note) for note in self.notes)}}}"
+            object.__setattr__(self, "_str", formatted)
+            return formatted
+        return self._str
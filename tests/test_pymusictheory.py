@@ -1,4 +1,14 @@
-from pymusictheory import Chord, Interval, Note, NoteInOctave, NoteLetter
+import copy
+import pickle
+
+from pymusictheory import (
+    Chord,
+    Interval,
+    Note,
+    NoteAlteration,
+    NoteInOctave,
+    NoteLetter,
+)
 
 
 class TestNoteLetter:
@@ -32,6 +42,11 @@ class TestNoteLetter:
 
         assert actual == expected, f"Expected {expected}, but got {actual}"
 
+    def test_int(self) -> None:
+        assert int(NoteLetter.C) == 0
+        assert int(NoteLetter.G) == 4
+        assert int(NoteLetter.B) == 6
+
 
 class TestNote:
     def test_semitone_offset(self) -> None:
@@ -84,6 +99,36 @@ class TestNote:
         assert Note.from_str("A##") != Note.from_str("B")
         assert Note.from_str("Bbb") != Note.from_str("A")
 
+    def test_interned(self) -> None:
+        # Equal notes should be the same object, no matter how they were created
+        note = Note.from_str("E♭")
+        assert note is Note.from_str("Eb")
+        assert note is Note(NoteLetter.E, NoteAlteration.FLAT)
+        assert any(other is note for other in Note.from_semitone_offset(3))
+        assert copy.deepcopy(note) is note
+        assert pickle.loads(pickle.dumps(note)) is note
+
+    def test_immutable(self) -> None:
+        # Notes are shared, so changing one would change it everywhere
+        note = Note.from_str("C")
+        try:
+            note.letter = NoteLetter.D
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError
+        assert Note(NoteLetter.C, NoteAlteration.NATURAL).letter == NoteLetter.C
+        assert str(Note.from_str("C")) == "C"
+
+
+class TestInterval:
+    def test_distances(self) -> None:
+        assert Interval.MINOR_THIRD.semitone_distance == 3
+        assert Interval.MINOR_THIRD.letter_distance == 2
+        assert Interval.PERFECT_FIFTH.semitone_distance == 7
+        assert Interval.PERFECT_FIFTH.letter_distance == 4
+        assert Interval.PERFECT_OCTAVE.value == (12, 7)
+
 
 class TestNoteInOctave:
     def test_eq(self) -> None:
@@ -96,6 +141,30 @@ class TestNoteInOctave:
         # Should not be equal
         assert NoteInOctave.from_str("C4") != NoteInOctave.from_str("D4")
         assert NoteInOctave.from_str("C4") != NoteInOctave.from_str("Cb5")
+        # Other types are never equal
+        assert NoteInOctave.from_str("C4") != "C4"
+        assert NoteInOctave.from_str("C4") != 48
+
+    def test_from_str(self) -> None:
+        assert NoteInOctave.from_str("C4") == NoteInOctave.from_str("C4")
+        assert str(NoteInOctave.from_str("D♯5")) == "D♯5"
+        assert str(NoteInOctave.from_str("Bb10")) == "B♭10"
+
+    def test_immutable(self) -> None:
+        # The absolute semitone offset and hash are derived from the note and
+        # octave, so neither may change after construction
+        note = NoteInOctave.from_str("C4")
+        try:
+            note.octave = 5
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError
+        assert str(note) == "C4"
+        assert int(note) == 48
+        assert str(NoteInOctave.from_str("C4")) == "C4"
+        assert copy.deepcopy(note) == note
+        assert pickle.loads(pickle.dumps(note)) == note
 
     def test_absolute_semitone_offset(self) -> None:
         assert NoteInOctave.from_str("C1").absolute_semitone_offset == 12
@@ -103,6 +172,7 @@ class TestNoteInOctave:
         assert NoteInOctave.from_str("Cb2").absolute_semitone_offset == 23
         assert NoteInOctave.from_str("B#1").absolute_semitone_offset == 24
         assert NoteInOctave.from_str("G#2").absolute_semitone_offset == 32
+        assert NoteInOctave.from_str("C10").absolute_semitone_offset == 120
 
     def test_from_absolute_semitone_offset(self) -> None:
         assert NoteInOctave.from_absolute_semitone_offset(28) == set(
@@ -154,6 +224,18 @@ class TestNoteInOctave:
                 NoteInOctave.from_str("A#0"),
             ]
         )
+        # B# and B## would be in octave -1, so they are left out
+        assert NoteInOctave.from_absolute_semitone_offset(0) == {
+            NoteInOctave.from_str("C0"),
+            NoteInOctave.from_str("Dbb0"),
+        }
+
+    def test_from_absolute_semitone_offset_is_shared(self) -> None:
+        # Results come from precomputed tables, so they must be immutable
+        notes = NoteInOctave.from_absolute_semitone_offset(48)
+        assert isinstance(notes, frozenset)
+        assert notes is NoteInOctave.from_str("C4").from_semitone_distance(0)
+        assert isinstance(Note.from_semitone_offset(0), frozenset)
 
     def test_from_semitone_distance(self) -> None:
         actual = NoteInOctave.from_str("C4").from_semitone_distance(0)
@@ -362,3 +444,70 @@ class TestChord:
             }
         )
         assert str(chord) == r"{C4,E4,G4}"
+
+    def test_iter(self) -> None:
+        # Iterating over a chord should give its unique notes from lowest to highest
+        chord = Chord(
+            [
+                NoteInOctave.from_str("G4"),
+                NoteInOctave.from_str("C4"),
+                NoteInOctave.from_str("E4"),
+                NoteInOctave.from_str("C4"),
+            ]
+        )
+        assert list(chord) == [
+            NoteInOctave.from_str("C4"),
+            NoteInOctave.from_str("E4"),
+            NoteInOctave.from_str("G4"),
+        ]
+
+    def test_eq(self) -> None:
+        # Chords with the same notes are equal, regardless of order or duplicates
+        c_major = Chord(
+            {
+                NoteInOctave.from_str("C4"),
+                NoteInOctave.from_str("E4"),
+                NoteInOctave.from_str("G4"),
+            }
+        )
+        assert c_major == Chord(
+            [
+                NoteInOctave.from_str("G4"),
+                NoteInOctave.from_str("E4"),
+                NoteInOctave.from_str("C4"),
+                NoteInOctave.from_str("C4"),
+            ]
+        )
+        assert len({c_major, Chord(list(c_major))}) == 1
+        # Chords with different notes are not equal
+        assert c_major != Chord(
+            {
+                NoteInOctave.from_str("C4"),
+                NoteInOctave.from_str("Eb4"),
+                NoteInOctave.from_str("G4"),
+            }
+        )
+
+    def test_immutable(self) -> None:
+        # The hash and string of a chord are cached, so its notes may not change
+        chord = Chord(
+            {
+                NoteInOctave.from_str("C4"),
+                NoteInOctave.from_str("E4"),
+                NoteInOctave.from_str("G4"),
+            }
+        )
+        try:
+            chord.notes = (NoteInOctave.from_str("D4"),)
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError
+        assert str(chord) == r"{C4,E4,G4}"
+        assert list(chord) == [
+            NoteInOctave.from_str("C4"),
+            NoteInOctave.from_str("E4"),
+            NoteInOctave.from_str("G4"),
+        ]
+        assert copy.deepcopy(chord) == chord
+        assert pickle.loads(pickle.dumps(chord)) == chord